@@ -17,6 +17,7 @@ export const translateTextToSign = async (req, res) => {
       text_language = "english",
       sign_language = "pk-sl",
       output_format = "video",
+      encoding_mode = "pipelined",
     } = req.body;
 
     if (!text || !text.trim()) {
@@ -46,6 +47,7 @@ export const translateTextToSign = async (req, res) => {
       text_language,
       sign_language,
       output_format,
+      encoding_mode,
     });
 
     // Determine Python command (prefer python3.12 or python3.11 for compatibility)
@@ -127,6 +129,9 @@ export const translateTextToSign = async (req, res) => {
         video_path: result.video_path,
         video_url: result.video_url,
         landmarks_path: result.landmarks_path,
+        variants: result.variants,
+        missing_variants: result.missing_variants,
+        landmarks_error: result.landmarks_error,
       },
       record: translationRecord,
     });
@@ -1,4 +1,6 @@
 import express from "express";
+import os from "os";
+import path from "path";
 import {
   createTranslation,
   getUserTranslations,
@@ -21,6 +23,34 @@ const translationValidation = [
     .withMessage("Invalid direction"),
 ];
 
+// Files written by translationService.py (videos, poster, landmarks stream).
+// Served before auth: <video>/<img> tags cannot send the bearer token. Names are
+// translation_<first 8 hex of md5(text)>, so only the exact names the service
+// writes for video output are served; anything else in the directory is a 404.
+// Content types come from the file extensions.
+const TRANSLATION_FILE_PATTERN =
+  /^\/translation_[0-9a-f]{8}(_low_res\.mp4|_low_fps\.mp4|\.mp4|_poster\.jpg|_landmarks\.json|_landmarks\.bin)$/;
+
+router.use(
+  "/video",
+  (req, res, next) => {
+    if (!TRANSLATION_FILE_PATTERN.test(req.path)) {
+      return res.status(404).json({ success: false, message: "File not found" });
+    }
+    next();
+  },
+  express.static(path.join(os.tmpdir(), "signlearn_translations"), {
+    fallthrough: false,
+    index: false,
+    maxAge: "1h",
+    setHeaders: (res, filePath) => {
+      if (filePath.endsWith(".bin")) {
+        res.setHeader("Content-Type", "application/octet-stream");
+      }
+    },
+  })
+);
+
 router.use(verifyToken);
 
 // using python service
@@ -36,8 +66,12 @@ const translateValidation = [
     .withMessage("Invalid sign language"),
   body("output_format")
     .optional()
-    .isIn(["video", "landmarks"])
+    .isIn(["video", "landmarks", "variants"])
     .withMessage("Invalid output format"),
+  body("encoding_mode")
+    .optional()
+    .isIn(["pipelined", "sequential"])
+    .withMessage("Invalid encoding mode"),
 ];
 
 router.post("/translate", translateValidation, translateTextToSign);
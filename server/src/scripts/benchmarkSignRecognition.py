@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Benchmark for single-sign recognition.
+Compares the exhaustive dictionary scan (match_with_dictionary_words) with
+the early-exit cascade (cascade_match) on synthetic hands and dictionaries.
+
+With --fit, fits the known-sign (distance) confidence mapping on labelled
+synthetic hands (noisy copies of dictionary patterns, plus hands that
+match no word) and reports expected calibration error (ECE) on a held-out
+set, alongside the ECE of the dictionary match confidence (score capped
+at MAX_MATCH_CONFIDENCE, which is not fitted).
+
+Usage: python benchmarkSignRecognition.py [--fit] [dictionary_size] [queries]
+"""
+
+import sys
+import time
+import random
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "services"))
+
+from signRecognitionService import (  # noqa: E402
+    match_with_dictionary_words, cascade_match, rank_dictionary_words, rank_known_signs,
+    extract_gesture_features, normalize_landmarks, calibrate_confidence,
+    fit_confidence_calibration, DISTANCE_CALIBRATION, MAX_MATCH_CONFIDENCE
+)
+
+
+WORD_STEMS = [
+    "hello", "hi", "good", "ok", "yes", "no", "stop", "open", "close",
+    "one", "two", "three", "four", "five", "water", "food", "book",
+    "house", "family", "friend", "school", "teacher", "happy", "sad",
+]
+CATEGORIES = ["greeting", "number", "object", "general", "emotion"]
+# Share of dictionary words carrying a landmark pattern. The Node controller sends
+# none (Word has no landmarks), so 0.0 is the production-shaped headline figure
+PATTERN_FRACTIONS = [0.0, 0.2]
+GENUINE_FRACTION = 0.7  # Share of labelled queries that copy a dictionary pattern
+ECE_BINS = 10
+
+
+def make_hand(rng, open_fingers):
+    """
+    Build a synthetic 21-point hand with the given fingers extended.
+
+    Args:
+        rng: numpy random generator
+        open_fingers: Set of finger indices (0 = thumb ... 4 = pinky) that are extended
+
+    Returns:
+        Landmarks list [[x, y, z], ...]
+    """
+    landmarks = [[0.0, 0.0, 0.0]]
+    for finger in range(5):
+        x = -0.3 + finger * 0.15
+        for joint in range(1, 5):
+            if finger in open_fingers or joint < 2:
+                y = -0.25 * joint
+            else:
+                # Curled finger: tip folds back below the middle joint
+                y = -0.25 + 0.1 * (joint - 1)
+            landmarks.append([x, y, 0.01 * joint])
+
+    hand = np.array(landmarks) + rng.normal(0.0, 0.02, (21, 3))
+    scale = rng.uniform(0.5, 2.0)
+    offset = rng.uniform(-1.0, 1.0, 3)
+    return (hand * scale + offset).tolist()
+
+
+def random_hand(rng):
+    """Synthetic hand with a random set of extended fingers"""
+    open_fingers = {finger for finger in range(5) if rng.random() < 0.5}
+    return make_hand(rng, open_fingers)
+
+
+def make_dictionary(rng, size, pattern_fraction=0.0):
+    """Synthetic dictionary in the shape sent by the Node controller, plus optional patterns"""
+    words = []
+    for index in range(size):
+        word = {
+            "word": f"{WORD_STEMS[index % len(WORD_STEMS)]}_{index}",
+            "category": CATEGORIES[int(rng.integers(len(CATEGORIES)))],
+            "difficulty": "beginner",
+        }
+        if rng.random() < pattern_fraction:
+            word["landmarks"] = random_hand(rng)
+        words.append(word)
+    return words
+
+
+def noisy_copy(rng, pattern):
+    """Query hand made from a dictionary pattern with per-point noise of random strength"""
+    hand = np.array(pattern)
+    scale = np.linalg.norm(hand[12] - hand[0])
+    return (hand + rng.normal(0.0, rng.uniform(0.01, 0.08) * scale, hand.shape)).tolist()
+
+
+def make_labelled_queries(rng, dictionary_words, count):
+    """Queries with the word they were made from (None for hands matching no word)"""
+    pattern_words = [word for word in dictionary_words if "landmarks" in word]
+    queries = []
+    for _ in range(count):
+        if rng.random() < GENUINE_FRACTION:
+            word = pattern_words[int(rng.integers(len(pattern_words)))]
+            queries.append((noisy_copy(rng, word["landmarks"]), word["word"]))
+        else:
+            queries.append((random_hand(rng), None))
+    return queries
+
+
+def score_samples(queries, dictionary_words):
+    """(score, correct) of the dictionary match for each labelled query"""
+    samples = []
+    for hand, label in queries:
+        best_match, best_score = rank_dictionary_words(
+            extract_gesture_features(hand), normalize_landmarks(hand), dictionary_words
+        )
+        samples.append((best_score, best_match == label))
+    return samples
+
+
+def distance_samples(queries, dictionary_words):
+    """(distance, margin, correct) of the known-sign match for each labelled query"""
+    known_signs = {word["word"]: word for word in dictionary_words if "landmarks" in word}
+    samples = []
+    for hand, label in queries:
+        best_match, best_distance, second_distance = rank_known_signs(normalize_landmarks(hand), known_signs)
+        samples.append((best_distance, second_distance - best_distance, best_match == label))
+    return samples
+
+
+def expected_calibration_error(confidences, correct):
+    """Weighted mean gap between confidence and accuracy over ECE_BINS confidence bins"""
+    confidences = np.array(confidences, dtype=float)
+    correct = np.array(correct, dtype=float)
+    bins = np.minimum((confidences * ECE_BINS).astype(int), ECE_BINS - 1)
+    error = 0.0
+    for index in range(ECE_BINS):
+        in_bin = bins == index
+        if in_bin.any():
+            error += in_bin.sum() * abs(confidences[in_bin].mean() - correct[in_bin].mean())
+    return error / len(confidences)
+
+
+def distance_calibration_error(samples, calibration):
+    """ECE of a known-sign calibration on (distance, margin, correct) samples"""
+    confidences = [calibrate_confidence(value, margin, calibration) for value, margin, _ in samples]
+    return expected_calibration_error(confidences, [label for _, _, label in samples])
+
+
+def fit(dictionary_size, query_count):
+    """Fit the known-sign calibration on a training set and report held-out ECE"""
+    rng = np.random.default_rng(0)
+    dictionary_words = make_dictionary(rng, dictionary_size, pattern_fraction=0.2)
+    for word in dictionary_words[:max(2, dictionary_size // 2)]:
+        word.setdefault("landmarks", random_hand(rng))
+    training = make_labelled_queries(rng, dictionary_words, query_count)
+    held_out = make_labelled_queries(rng, dictionary_words, query_count)
+
+    print(f"dictionary words: {dictionary_size}, labelled queries: {query_count} train + {query_count} held out")
+
+    test_samples = score_samples(held_out, dictionary_words)
+    scores, labels = zip(*test_samples)
+    confidences = [min(MAX_MATCH_CONFIDENCE, score) for score in scores]
+    print(f"score: accuracy {np.mean(labels) * 100:.1f}%")
+    print(f"  current ECE: {expected_calibration_error(confidences, labels):.3f} (not fitted)")
+
+    train_samples = distance_samples(training, dictionary_words)
+    test_samples = distance_samples(held_out, dictionary_words)
+    values, margins, labels = zip(*train_samples)
+    fitted = fit_confidence_calibration(values, margins, labels, DISTANCE_CALIBRATION["margin_cap"])
+    accuracy = np.mean([label for _, _, label in test_samples])
+    print(f"distance: accuracy {accuracy * 100:.1f}%")
+    print(f"  current ECE: {distance_calibration_error(test_samples, DISTANCE_CALIBRATION):.3f}")
+    print(f"  fitted ECE:  {distance_calibration_error(test_samples, fitted):.3f}")
+    print(f"  fitted: {{{', '.join(f'{key!r}: {value:.3f}' for key, value in fitted.items())}}}")
+
+
+def time_calls(function, queries, dictionary_words, repeats=3):
+    """Best-of-repeats wall time per call (seconds) and the results of the last run"""
+    best = float("inf")
+    results = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        results = [function(query, dictionary_words) for query in queries]
+        best = min(best, time.perf_counter() - start)
+    return best / len(queries), results
+
+
+def main():
+    arguments = [argument for argument in sys.argv[1:] if argument != "--fit"]
+    dictionary_size = int(arguments[0]) if arguments else 500
+    query_count = int(arguments[1]) if len(arguments) > 1 else 200
+
+    if "--fit" in sys.argv:
+        fit(dictionary_size, query_count * 10)
+        return
+
+    print(f"dictionary words: {dictionary_size}, queries: {query_count}")
+    for pattern_fraction in PATTERN_FRACTIONS:
+        rng = np.random.default_rng(0)
+        random.seed(0)
+
+        dictionary_words = make_dictionary(rng, dictionary_size, pattern_fraction)
+        queries = [random_hand(rng) for _ in range(query_count)]
+
+        exhaustive_time, exhaustive_results = time_calls(match_with_dictionary_words, queries, dictionary_words)
+        cascade_time, cascade_results = time_calls(cascade_match, queries, dictionary_words)
+
+        # Same word and same confidence
+        agreement = np.mean([
+            exhaustive[0] == cascade[0] and abs(exhaustive[1] - cascade[1]) < 1e-9
+            for exhaustive, cascade in zip(exhaustive_results, cascade_results)
+        ])
+
+        label = "production (no patterns)" if pattern_fraction == 0 else f"{pattern_fraction:.0%} with patterns"
+        print(f"{label}:")
+        print(f"  exhaustive: {exhaustive_time * 1000:.3f} ms/query")
+        print(f"  cascade:    {cascade_time * 1000:.3f} ms/query")
+        print(f"  speedup:    {exhaustive_time / cascade_time:.1f}x")
+        print(f"  agreement:  {agreement * 100:.1f}%")
+
+
+if __name__ == "__main__":
+    main()
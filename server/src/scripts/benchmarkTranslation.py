@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Benchmark for text-to-sign video encoding.
+Times translate_text_to_sign in sequential mode, pipelined mode on one
+process, and pipelined mode with parallel sentence segments (best of
+REPEATS runs each). Runs where the service declined to encode in
+parallel (too few segments or CPUs, or no ffmpeg) are marked skipped.
+
+Usage: python benchmarkTranslation.py [--synthetic] [sentences] [workers ...]
+
+--synthetic replaces sign_language_translator with a stand-in that loads
+slowly and produces frames at a fixed per-frame cost, so the encoding
+paths can be timed where the library or its datasets are not installed.
+"""
+
+import os
+import sys
+import time
+import types
+from pathlib import Path
+
+if "--synthetic" in sys.argv:
+    # Environment variable so spawned worker processes install it too
+    os.environ["SIGNLEARN_SYNTHETIC_SYNTHESIS"] = "1"
+
+SYNTHETIC_MODEL_LOAD_SECONDS = 0.5
+SYNTHETIC_FRAMES_PER_WORD = 20
+SYNTHETIC_FRAME_SIZE = (480, 640)
+
+
+class SyntheticVideo:
+    """Stand-in for the library's Video: frames are generated lazily"""
+
+    def __init__(self, word_count):
+        self.frame_count = word_count * SYNTHETIC_FRAMES_PER_WORD
+
+    def iter_frames(self):
+        import cv2
+        import numpy as np
+
+        height, width = SYNTHETIC_FRAME_SIZE
+        for index in range(self.frame_count):
+            frame = np.full((height, width, 3), index % 255, dtype=np.uint8)
+            # Stand-in for decoding and blending the source clips
+            yield cv2.GaussianBlur(frame, (15, 15), 0)
+
+
+class SyntheticSynthesis:
+    """Stand-in for ConcatenativeSynthesis"""
+
+    def __init__(self, text_language, sign_language, sign_format):
+        time.sleep(SYNTHETIC_MODEL_LOAD_SECONDS)
+
+    def translate(self, text):
+        return SyntheticVideo(len(text.split()))
+
+
+def install_synthetic_library():
+    """Register the stand-in as sign_language_translator"""
+    library = types.ModuleType("sign_language_translator")
+    library.models = types.SimpleNamespace(ConcatenativeSynthesis=SyntheticSynthesis)
+    sys.modules["sign_language_translator"] = library
+
+
+if os.environ.get("SIGNLEARN_SYNTHETIC_SYNTHESIS") == "1":
+    install_synthetic_library()
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "services"))
+
+from translationService import translate_text_to_sign  # noqa: E402
+
+
+SENTENCE = "The teacher reads a good book to the family at school every day."
+REPEATS = 3
+
+
+def time_translation(text, repeats=REPEATS, **options):
+    """Best-of-repeats wall time (seconds) and the result of the last run"""
+    best = float("inf")
+    result = {}
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = translate_text_to_sign(text, "english", "pk-sl", "video", **options)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    arguments = [argument for argument in sys.argv[1:] if argument != "--synthetic"]
+    sentence_count = int(arguments[0]) if arguments else 8
+    worker_counts = [int(argument) for argument in arguments[1:]] or [2, 4]
+
+    text = " ".join([SENTENCE] * sentence_count)
+    print(f"sentences: {sentence_count}, characters: {len(text)}, cpus: {os.cpu_count()}")
+
+    runs = [("sequential", {"encoding_mode": "sequential"})]
+    runs.append(("pipelined, 1 worker", {"encoding_mode": "pipelined", "max_workers": 1}))
+    for worker_count in worker_counts:
+        runs.append((f"pipelined, {worker_count} workers", {"encoding_mode": "pipelined", "max_workers": worker_count}))
+
+    baseline = None
+    for label, options in runs:
+        elapsed, result = time_translation(text, **options)
+        if not result.get("success") or not result.get("video_path"):
+            print(f"{label:<24} failed: {result}")
+            continue
+        if options.get("max_workers", 1) > 1 and "segment_count" not in result:
+            reason = result.get("parallel_error", "not eligible on this machine")
+            print(f"{label:<24} {elapsed:7.2f} s  parallel skipped ({reason})")
+            continue
+        baseline = baseline or elapsed
+        segments = result.get("segment_count", 1)
+        print(f"{label:<24} {elapsed:7.2f} s  {baseline / elapsed:4.1f}x  segments: {segments}")
+
+
+if __name__ == "__main__":
+    main()
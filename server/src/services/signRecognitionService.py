@@ -18,6 +18,20 @@ except ImportError:
     pass
 
 
+MIN_MATCH_SCORE = 0.3  # Below this the dictionary match is not trusted
+BASIC_GESTURE_CONFIDENCE = 0.5
+MAX_MATCH_CONFIDENCE = 0.95  # Dictionary match confidence is the score, capped here
+MAX_FINGER_DIFFERENCE = 1  # Discrete pruning tolerance for open-finger count
+LANDMARK_DISTANCE_SCALE = 0.1
+
+# Logistic (Platt) confidence for known signs:
+# confidence = sigmoid(w_value * distance + w_margin * margin + bias), where "margin" is the
+# lead over the second-best sign, capped at margin_cap. Refit with fit_confidence_calibration.
+# Fitted with `scripts/benchmarkSignRecognition.py --fit` on labelled synthetic hands
+# (held-out ECE 0.128 -> 0.067); refit once real labelled recognitions exist
+DISTANCE_CALIBRATION = {"w_value": -3.661, "w_margin": 7.165, "bias": 0.657, "margin_cap": 0.5}
+
+
 def normalize_landmarks(landmarks):
     """
     Normalize landmarks to make them scale-invariant and position-invariant.
@@ -85,6 +99,64 @@ def calculate_landmark_distance(lm1, lm2):
     return np.mean(distances) if distances else float('inf')
 
 
+def calibrate_confidence(value, margin, calibration=DISTANCE_CALIBRATION):
+    """
+    Map a match value and its margin over the runner-up to a confidence (logistic mapping).
+    
+    Args:
+        value: Landmark distance of the best candidate
+        margin: Lead of the best candidate over the second-best one
+        calibration: Platt-scaling parameters
+        
+    Returns:
+        Confidence (0.0 - 1.0)
+    """
+    if math.isinf(value):
+        return 0.0
+    margin = min(max(margin, 0.0), calibration["margin_cap"])
+    logit = (
+        calibration["w_value"] * value +
+        calibration["w_margin"] * margin +
+        calibration["bias"]
+    )
+    return 1.0 / (1.0 + math.exp(-logit))
+
+
+def fit_confidence_calibration(values, margins, labels, margin_cap, iterations=2000, learning_rate=0.5):
+    """
+    Fit Platt-scaling parameters from labelled recognitions.
+    
+    Args:
+        values: Match values of the recognized candidates
+        margins: Margins over the second-best candidates
+        labels: 1 if the recognition was correct, 0 otherwise
+        margin_cap: Margin above which a recognition counts as fully decided
+        iterations: Gradient descent iterations
+        learning_rate: Gradient descent step size
+        
+    Returns:
+        Calibration dictionary usable by calibrate_confidence
+    """
+    features = np.column_stack([
+        np.asarray(values, dtype=float),
+        np.clip(np.asarray(margins, dtype=float), 0.0, margin_cap),
+        np.ones(len(values))
+    ])
+    targets = np.asarray(labels, dtype=float)
+    weights = np.zeros(3)
+    
+    for _ in range(iterations):
+        predictions = 1.0 / (1.0 + np.exp(-features @ weights))
+        weights -= learning_rate * features.T @ (predictions - targets) / len(targets)
+    
+    return {
+        "w_value": float(weights[0]),
+        "w_margin": float(weights[1]),
+        "bias": float(weights[2]),
+        "margin_cap": margin_cap
+    }
+
+
 def recognize_sign_from_landmarks(landmarks, known_signs):
     """
     Recognize sign from landmarks by comparing with known signs.
@@ -102,9 +174,26 @@ def recognize_sign_from_landmarks(landmarks, known_signs):
     # Normalize input landmarks
     normalized_input = normalize_landmarks(landmarks)
     
+    best_match, best_distance, second_distance = rank_known_signs(normalized_input, known_signs)
+    
+    if best_match is None:
+        return None, 0.0
+    
+    # A lone known sign has no runner-up: treat the margin as saturated
+    margin = second_distance - best_distance if not math.isinf(second_distance) else DISTANCE_CALIBRATION["margin_cap"]
+    return best_match, calibrate_confidence(best_distance, margin, DISTANCE_CALIBRATION)
+
+
+def rank_known_signs(normalized_input, known_signs):
+    """
+    Find the two known signs closest to normalized input landmarks.
+    
+    Returns:
+        Tuple of (best_word, best_distance, second_distance)
+    """
     best_match = None
     best_distance = float('inf')
-    best_confidence = 0.0
+    second_distance = float('inf')
     
     # Compare with each known sign
     for word, sign_pattern in known_signs.items():
@@ -127,15 +216,14 @@ def recognize_sign_from_landmarks(landmarks, known_signs):
         # Calculate distance
         distance = calculate_landmark_distance(normalized_input, normalized_pattern)
         
-        # Convert distance to confidence (inverse relationship)
-        confidence = 1.0 / (1.0 + distance * 10)
-        
         if distance < best_distance:
+            second_distance = best_distance
             best_distance = distance
             best_match = word
-            best_confidence = confidence
+        elif distance < second_distance:
+            second_distance = distance
     
-    return best_match, best_confidence
+    return best_match, best_distance, second_distance
 
 
 def recognize_sign_sequence(landmark_sequence, known_signs, threshold=0.3):
@@ -181,6 +269,7 @@ def match_with_dictionary_words(landmarks, dictionary_words):
     """
     Match landmarks with words from dictionary database.
     Uses feature-based matching and word hints.
+    Scores every word; cascade_match returns the same result with less work.
     
     Args:
         landmarks: Hand landmarks array
@@ -198,48 +287,189 @@ def match_with_dictionary_words(landmarks, dictionary_words):
     
     # If no dictionary words, use basic detection
     if not dictionary_words or len(dictionary_words) == 0:
-        word = detect_basic_gesture(landmarks)
-        return word, 0.5
+        word = detect_basic_gesture(landmarks, input_features)
+        return word, BASIC_GESTURE_CONFIDENCE
     
-    # Match with dictionary words using feature similarity
+    best_match, best_score = rank_dictionary_words(input_features, normalized_input, dictionary_words)
+    return resolve_dictionary_match(landmarks, input_features, best_match, best_score)
+
+
+def rank_dictionary_words(input_features, normalized_input, dictionary_words):
+    """
+    Score every dictionary word and keep the best one.
+    
+    Words whose landmark pattern disagrees with the input on thumb state
+    or open-finger count are not candidates (as in cascade_match).
+    Ties go to the earlier dictionary entry.
+    
+    Returns:
+        Tuple of (best_word, best_score)
+    """
     best_match = None
     best_score = 0.0
-    best_confidence = 0.0
     
     for dict_word in dictionary_words:
         word_name = dict_word.get("word", "").lower()
         category = dict_word.get("category", "").lower()
+        pattern_landmarks = get_pattern_landmarks(dict_word)
+        
+        if pattern_landmarks is not None and not discrete_features_compatible(
+            input_features, discrete_hand_features(pattern_landmarks)
+        ):
+            continue
         
         # Calculate similarity score based on features
         score = calculate_word_similarity(
-            input_features, normalized_input, word_name, category
+            input_features, normalized_input, word_name, category, pattern_landmarks
         )
         
         if score > best_score:
             best_score = score
             best_match = dict_word.get("word", word_name)
-            best_confidence = min(0.95, score)
     
-    # If no good match found, use basic detection
-    if best_score < 0.3:
-        word = detect_basic_gesture(landmarks)
-        return word, 0.5
+    return best_match, best_score
+
+
+def resolve_dictionary_match(landmarks, input_features, best_match, best_score):
+    """
+    Confidence and fallback shared by match_with_dictionary_words and cascade_match.
+    
+    Confidence is the best score capped at MAX_MATCH_CONFIDENCE (not
+    calibrated: there are no labelled dictionary recognitions to fit on).
+    When no word scores at least MIN_MATCH_SCORE, the basic gesture is
+    returned instead, never with more confidence than the match it replaces.
+    
+    Returns:
+        Tuple of (word, confidence)
+    """
+    confidence = min(MAX_MATCH_CONFIDENCE, best_score)
+    
+    if best_match is None or best_score < MIN_MATCH_SCORE:
+        word = detect_basic_gesture(landmarks, input_features)
+        return word, min(BASIC_GESTURE_CONFIDENCE, confidence)
+    
+    return best_match, confidence
+
+
+def cascade_match(landmarks, dictionary_words):
+    """
+    Match landmarks with dictionary words using an early-exit cascade.
+    
+    Stage 1 scores every word on cheap discrete features (open-finger
+    count, thumb state, word and category hints) and bounds the gesture
+    pattern term. Words whose landmark pattern disagrees on the discrete
+    features, or whose upper bound is below the best lower bound, are
+    pruned. Stage 2 computes the exact pattern term (landmark distance)
+    for survivors in upper-bound order and stops once no remaining word
+    can beat (or tie with) the best score.
+    
+    Returns the same word and confidence as match_with_dictionary_words.
+    
+    Args:
+        landmarks: Hand landmarks array
+        dictionary_words: List of words from database
+        
+    Returns:
+        Best matching word with confidence
+    """
+    if not landmarks or len(landmarks) == 0:
+        return None, 0.0
+    
+    input_features = extract_gesture_features(landmarks)
+    
+    if not dictionary_words or len(dictionary_words) == 0:
+        word = detect_basic_gesture(landmarks, input_features)
+        return word, BASIC_GESTURE_CONFIDENCE
+    
+    has_hand = len(landmarks) >= 21
+    
+    # Stage 1: discrete features and score bounds
+    candidates = []
+    best_lower = 0.0
+    for index, dict_word in enumerate(dictionary_words):
+        word_name = dict_word.get("word", "").lower()
+        category = dict_word.get("category", "").lower()
+        pattern_landmarks = get_pattern_landmarks(dict_word)
+        
+        if pattern_landmarks is not None:
+            if not discrete_features_compatible(input_features, discrete_hand_features(pattern_landmarks)):
+                continue
+            pattern_low, pattern_high = 0.0, 1.0
+        else:
+            pattern_low, pattern_high = gesture_pattern_bounds(word_name, has_hand)
+        
+        base_score = calculate_base_similarity(input_features, word_name, category)
+        lower = min(1.0, base_score + pattern_low * 0.3)
+        upper = min(1.0, base_score + pattern_high * 0.3)
+        best_lower = max(best_lower, lower)
+        candidates.append((upper, lower, index, base_score, dict_word, word_name, pattern_landmarks))
+    
+    # Stage 2: exact scoring of survivors, best upper bound first.
+    # A word below the best lower bound cannot be the best.
+    survivors = [candidate for candidate in candidates if candidate[0] >= best_lower]
+    survivors.sort(key=lambda candidate: (-candidate[0], candidate[2]))
+    
+    normalized_input = None
+    best_match = None
+    best_index = None
+    best_score = 0.0
+    
+    for upper, lower, index, base_score, dict_word, word_name, pattern_landmarks in survivors:
+        if upper < best_score:
+            break
+        
+        if upper == lower:
+            score = upper
+        else:
+            if normalized_input is None:
+                normalized_input = normalize_landmarks(landmarks)
+            pattern_score = (
+                landmark_similarity(normalized_input, pattern_landmarks)
+                if pattern_landmarks is not None
+                else match_gesture_pattern(normalized_input, word_name)
+            )
+            score = min(1.0, base_score + pattern_score * 0.3)
+        
+        # Ties go to the earlier dictionary entry, as in rank_dictionary_words
+        if score > best_score or (score == best_score and best_index is not None and index < best_index):
+            best_score = score
+            best_match = dict_word.get("word", word_name)
+            best_index = index
     
-    return best_match, best_confidence
+    return resolve_dictionary_match(landmarks, input_features, best_match, best_score)
 
 
-def calculate_word_similarity(input_features, normalized_landmarks, word_name, category):
+def calculate_word_similarity(input_features, normalized_landmarks, word_name, category, pattern_landmarks=None):
     """
     Calculate similarity score between input and dictionary word.
     Uses multiple heuristics:
     1. Feature matching
     2. Word name hints
     3. Category hints
-    4. Gesture patterns
+    4. Gesture patterns (landmark distance when the word has a landmark pattern)
     
     Returns:
         Similarity score (0.0 - 1.0)
     """
+    score = calculate_base_similarity(input_features, word_name, category)
+    
+    # Gesture pattern matching (30% weight)
+    if pattern_landmarks is not None:
+        pattern_score = landmark_similarity(normalized_landmarks, pattern_landmarks)
+    else:
+        pattern_score = match_gesture_pattern(normalized_landmarks, word_name)
+    score += pattern_score * 0.3
+    
+    return min(1.0, score)
+
+
+def calculate_base_similarity(input_features, word_name, category):
+    """
+    Cheap part of calculate_word_similarity: everything but the gesture pattern.
+    
+    Returns:
+        Partial similarity score (0.0 - 0.7)
+    """
     score = 0.0
     
     # Feature-based matching (40% weight)
@@ -250,15 +480,66 @@ def calculate_word_similarity(input_features, normalized_landmarks, word_name, c
     category_score = match_by_category(input_features, category)
     score += category_score * 0.2
     
-    # Gesture pattern matching (30% weight)
-    pattern_score = match_gesture_pattern(normalized_landmarks, word_name)
-    score += pattern_score * 0.3
-    
     # Word name hints (10% weight)
     name_score = match_by_word_name(word_name)
     score += name_score * 0.1
     
-    return min(1.0, score)
+    return score
+
+
+def gesture_pattern_bounds(word_name, has_hand=True):
+    """
+    Bounds of match_gesture_pattern for a word, without touching landmarks.
+    Mirrors the branches of match_gesture_pattern; keep the two in sync.
+    
+    Returns:
+        Tuple of (lowest, highest) possible pattern score
+    """
+    if not has_hand:
+        return 0.2, 0.2
+    
+    word_lower = word_name.lower()
+    if "hello" in word_lower or "hi" in word_lower:
+        return 0.3, 0.7
+    if any(num in word_lower for num in ["one", "two", "three", "four", "five"]):
+        return 0.3, 0.8
+    return 0.3, 0.3
+
+
+def get_pattern_landmarks(dict_word):
+    """Return the landmark pattern stored with a dictionary word (or None)"""
+    pattern_landmarks = dict_word.get("landmarks") if isinstance(dict_word, dict) else None
+    if not pattern_landmarks or not isinstance(pattern_landmarks, list):
+        return None
+    return pattern_landmarks
+
+
+def landmark_similarity(normalized_landmarks, pattern_landmarks):
+    """Similarity (0.0 - 1.0) between normalized input landmarks and a raw landmark pattern"""
+    distance = calculate_landmark_distance(normalized_landmarks, normalize_landmarks(pattern_landmarks))
+    return math.exp(-distance / LANDMARK_DISTANCE_SCALE)
+
+
+def discrete_hand_features(landmarks):
+    """
+    Thumb state and open-finger count, as in extract_gesture_features.
+    Reads the landmark lists directly so it is cheap enough to run on every word.
+    """
+    if len(landmarks) < 21:
+        return {}
+    return {
+        "thumb_up": landmarks[4][1] < landmarks[3][1],
+        "fingers_open": sum(landmarks[i][1] < landmarks[i - 2][1] for i in [4, 8, 12, 16, 20]),
+    }
+
+
+def discrete_features_compatible(input_features, pattern_features, max_finger_difference=MAX_FINGER_DIFFERENCE):
+    """Cheap check that two hands agree on thumb state and (roughly) open-finger count"""
+    if not input_features or not pattern_features:
+        return True
+    if bool(input_features["thumb_up"]) != bool(pattern_features["thumb_up"]):
+        return False
+    return abs(int(input_features["fingers_open"]) - int(pattern_features["fingers_open"])) <= max_finger_difference
 
 
 def match_features_by_word(features, word_name):
@@ -391,13 +672,14 @@ def extract_gesture_features(landmarks):
     return features
 
 
-def detect_basic_gesture(landmarks):
+def detect_basic_gesture(landmarks, features=None):
     """
     Detect basic gestures using simple heuristics.
     Fallback when ML model is not available.
     
     Args:
         landmarks: Hand landmarks array
+        features: Features already extracted from landmarks (optional)
         
     Returns:
         Detected word (or None)
@@ -405,7 +687,8 @@ def detect_basic_gesture(landmarks):
     if not landmarks or len(landmarks) < 21:
         return None
     
-    features = extract_gesture_features(landmarks)
+    if features is None:
+        features = extract_gesture_features(landmarks)
     
     # Basic gesture detection
     if features.get("thumb_up") and not features.get("fingers_open", 0) > 2:
@@ -471,15 +754,15 @@ def main():
                 result["confidence"] = 0.0
         else:
             # Single sign recognition
-            # Use dictionary matching
+            # Use cascade dictionary matching (falls back to basic detection itself)
             if isinstance(landmarks[0], list) and isinstance(landmarks[0][0], (list, np.ndarray)):
                 # Multiple hands
                 all_words = []
                 all_confidences = []
+                hand_results = [cascade_match(hand_landmarks, dictionary_words) for hand_landmarks in landmarks]
                 
-                for hand_landmarks in landmarks:
-                    word, confidence = match_with_dictionary_words(hand_landmarks, dictionary_words)
-                    if word and confidence > 0.3:  # Threshold for valid recognition
+                for word, confidence in hand_results:
+                    if word and confidence >= MIN_MATCH_SCORE:  # Threshold for valid recognition
                         all_words.append(word)
                         all_confidences.append(confidence)
                 
@@ -487,21 +770,15 @@ def main():
                     result["recognized_text"] = " ".join(all_words)
                     result["confidence"] = float(np.mean(all_confidences))
                 else:
-                    # Fallback to basic detection
-                    word = detect_basic_gesture(landmarks[0] if landmarks else [])
+                    # Fall back to the first hand (basic gesture detection, low confidence)
+                    word, confidence = hand_results[0] if hand_results else (None, 0.0)
                     result["recognized_text"] = word if word else "unknown"
-                    result["confidence"] = 0.5
+                    result["confidence"] = float(confidence)
             else:
                 # Single hand - use dictionary matching
-                word, confidence = match_with_dictionary_words(landmarks, dictionary_words)
-                if word and confidence > 0.3:
-                    result["recognized_text"] = word
-                    result["confidence"] = float(confidence)
-                else:
-                    # Fallback to basic detection
-                    word = detect_basic_gesture(landmarks)
-                    result["recognized_text"] = word if word else "unknown"
-                    result["confidence"] = 0.5
+                word, confidence = cascade_match(landmarks, dictionary_words)
+                result["recognized_text"] = word if word else "unknown"
+                result["confidence"] = float(confidence)
         
         # Output result
         print(json.dumps(result))
@@ -8,7 +8,14 @@ text-to-sign translation functionality for the Node.js backend.
 import sys
 import json
 import os
+import re
+import queue
+import shutil
+import hashlib
 import tempfile
+import threading
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 try:
@@ -21,7 +28,515 @@ except ImportError:
     sys.exit(1)
 
 
-def translate_text_to_sign(text: str, text_language: str = "english", sign_language: str = "pk-sl", output_format: str = "video"):
+VIDEO_FPS = 30.0
+FRAME_QUEUE_SIZE = 64  # Max frames buffered between synthesis and encoding
+SENTENCE_SPLIT_PATTERN = re.compile(r'(?<=[.!?\u06d4\u0964])\s+')
+
+# Parallel segment encoding only pays off once the input outweighs loading
+# the synthesis model in every worker process (and needs ffmpeg to join segments)
+PARALLEL_MIN_SEGMENTS = 3
+PARALLEL_MIN_CHARS = 200
+
+SEGMENT_MODEL = None  # Synthesis model of a segment worker process, see init_segment_worker
+
+# Output variants produced from a single pass over the synthesized frames
+# (fps None keeps the frame rate of the synthesized sign)
+VIDEO_VARIANTS = {
+    "full": {"fps": None, "max_height": None},
+    # Sources already at or below 360p reuse the full video instead
+    "low_res": {"fps": None, "max_height": 360, "same_as": "full"},
+    "low_fps": {"fps": 15.0, "max_height": None},
+}
+POSTER_FRAME_INDEX = 15  # Half a second in, past the initial rest pose
+POSTER_MAX_HEIGHT = 240
+
+
+def split_into_segments(text: str):
+    """
+    Split text into independent sentence segments.
+    
+    Args:
+        text: Input text to split
+    
+    Returns:
+        List of non-empty sentence strings
+    """
+    segments = [segment.strip() for segment in SENTENCE_SPLIT_PATTERN.split(text)]
+    return [segment for segment in segments if segment]
+
+
+def get_sign_frames(sign):
+    """Return an iterable over the frames of a synthesized sign (or None)"""
+    if hasattr(sign, 'iter_frames'):
+        return sign.iter_frames()
+    if hasattr(sign, 'frames'):
+        return sign.frames
+    return None
+
+
+def get_sign_fps(sign):
+    """Frame rate of a synthesized sign (VIDEO_FPS when the sign does not say)"""
+    fps = getattr(sign, 'fps', None)
+    return float(fps) if fps else VIDEO_FPS
+
+
+def video_output(name: str, path, fps: float = None, max_height: int = None, same_as: str = None,
+                 source_fps: float = VIDEO_FPS):
+    """
+    Describe a video output written by write_outputs_pipelined.
+    
+    fps is the target frame rate (None keeps the source frame rate); see
+    resolve_frame_rates for adapting an output to the actual source.
+    same_as names another output to reuse when this one would not be
+    downscaled (it is then skipped rather than encoded as a duplicate).
+    """
+    output = {
+        "name": name,
+        "kind": "video",
+        "path": str(path),
+        "target_fps": fps,
+        "max_height": max_height,
+        "same_as": same_as,
+    }
+    return resolve_frame_rates([output], source_fps)[0]
+
+
+def resolve_frame_rates(outputs, source_fps: float):
+    """
+    Set the written frame rate and frame step of video outputs for a source frame rate.
+    
+    Frames are dropped in whole steps, so the written rate is the source
+    rate divided by the step (a 15 fps target is written at 15 fps from a
+    30 or 60 fps source, at 12.5 fps from a 25 fps source).
+    
+    Returns:
+        New list of output descriptions
+    """
+    resolved = []
+    for output in outputs:
+        if output["kind"] == "video":
+            target_fps = output["target_fps"] or source_fps
+            frame_step = max(1, int(round(source_fps / target_fps)))
+            output = dict(output, fps=source_fps / frame_step, frame_step=frame_step)
+        resolved.append(output)
+    return resolved
+
+
+def poster_output(path, frame_index: int = POSTER_FRAME_INDEX, max_height: int = POSTER_MAX_HEIGHT):
+    """Describe a poster thumbnail written by write_outputs_pipelined"""
+    return {
+        "name": "poster",
+        "kind": "image",
+        "path": str(path),
+        "frame_index": frame_index,
+        "max_height": max_height,
+    }
+
+
+def build_variant_outputs(stem: str, directory):
+    """
+    Build the output list for the multi-variant output mode.
+    
+    Args:
+        stem: Base filename shared by all variants
+        directory: Directory the variants are written to
+    
+    Returns:
+        List of output descriptions (the full-size video first)
+    """
+    directory = Path(directory)
+    outputs = []
+    for name, options in VIDEO_VARIANTS.items():
+        suffix = "" if name == "full" else f"_{name}"
+        outputs.append(video_output(name, directory / f"{stem}{suffix}.mp4", **options))
+    outputs.append(poster_output(directory / f"{stem}_poster.jpg"))
+    return outputs
+
+
+def fit_to_height(width: int, height: int, max_height: int = None):
+    """Scale a frame size down to max_height, keeping even dimensions for the encoder"""
+    if not max_height or height <= max_height:
+        return width, height
+    scaled_width = int(round(width * max_height / height))
+    return scaled_width - scaled_width % 2, max_height - max_height % 2
+
+
+def write_outputs_pipelined(frames, outputs, queue_size: int = FRAME_QUEUE_SIZE):
+    """
+    Fan synthesized frames out to several outputs, overlapping synthesis with encoding.
+    
+    The calling thread pulls frames from the (possibly lazy) synthesis
+    iterator and converts them to BGR, while a writer thread drains a
+    bounded queue and hands every frame to each output (resized and/or
+    frame-dropped as the output requires). Frames are decoded only once.
+    
+    Args:
+        frames: Iterable of RGB (or single-channel) frames
+        outputs: List of output descriptions (see video_output and poster_output)
+        queue_size: Maximum number of frames buffered between the two stages
+    
+    Returns:
+        Dictionary mapping output name to number of frames written
+    """
+    import cv2
+    
+    frame_queue = queue.Queue(maxsize=queue_size)
+    state = {
+        "frame_counts": {output["name"]: 0 for output in outputs},
+        "error": None,
+    }
+    
+    def resize(frame, size):
+        if (frame.shape[1], frame.shape[0]) == size:
+            return frame
+        return cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+    
+    def consume():
+        writers = {}
+        posters = {}
+        frame_index = 0
+        try:
+            while True:
+                frame = frame_queue.get()
+                if frame is None:
+                    break
+                # Keep draining after a failure so the producer never blocks
+                if state["error"] is not None:
+                    continue
+                try:
+                    height, width = frame.shape[:2]
+                    for output in outputs:
+                        name = output["name"]
+                        size = fit_to_height(width, height, output["max_height"])
+                        if output["kind"] == "image":
+                            # Keep the latest candidate in case the video is shorter
+                            if frame_index <= output["frame_index"]:
+                                posters[name] = resize(frame, size)
+                            continue
+                        if frame_index % output["frame_step"]:
+                            continue
+                        if output["same_as"] and size == (width, height):
+                            continue
+                        if name not in writers:
+                            fourcc = cv2.VideoWriter_fourcc(*'mp4v')
+                            writers[name] = cv2.VideoWriter(output["path"], fourcc, output["fps"], size)
+                        writers[name].write(resize(frame, size))
+                        state["frame_counts"][name] += 1
+                    frame_index += 1
+                except Exception as write_error:
+                    state["error"] = write_error
+            
+            if state["error"] is None:
+                for output in outputs:
+                    poster = posters.get(output["name"])
+                    if poster is not None and cv2.imwrite(output["path"], poster):
+                        state["frame_counts"][output["name"]] = 1
+        except Exception as write_error:
+            state["error"] = write_error
+        finally:
+            for writer in writers.values():
+                writer.release()
+    
+    consumer = threading.Thread(target=consume, daemon=True)
+    consumer.start()
+    try:
+        for frame in frames:
+            # Convert RGB to BGR for OpenCV
+            if len(frame.shape) == 3 and frame.shape[2] == 3:
+                frame = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
+            frame_queue.put(frame)
+    finally:
+        frame_queue.put(None)
+        consumer.join()
+    
+    if state["error"] is not None:
+        raise state["error"]
+    
+    return state["frame_counts"]
+
+
+def init_segment_worker(text_language: str, sign_language: str):
+    """Load the synthesis model once per worker process"""
+    global SEGMENT_MODEL
+    SEGMENT_MODEL = slt.models.ConcatenativeSynthesis(
+        text_language=text_language,
+        sign_language=sign_language,
+        sign_format="video"
+    )
+
+
+def encode_segment(task):
+    """
+    Synthesize and encode one sentence segment (runs in a worker process).
+    
+    Args:
+        task: Tuple of (segment_text, outputs)
+    
+    Returns:
+        Tuple of (frame counts, source fps). Frame counts map output name
+        to number of frames written (-1 when the library saved the video
+        and the count is unknown)
+    """
+    segment_text, outputs = task
+    
+    sign = SEGMENT_MODEL.translate(segment_text)
+    source_fps = get_sign_fps(sign)
+    
+    frames = get_sign_frames(sign)
+    if frames is None:
+        if not hasattr(sign, 'save'):
+            return {}, source_fps
+        # Frame count unknown, primary output saved by the library
+        sign.save(outputs[0]["path"], overwrite=True)
+        return {outputs[0]["name"]: -1}, source_fps
+    
+    return write_outputs_pipelined(frames, resolve_frame_rates(outputs, source_fps)), source_fps
+
+
+def concatenate_segments(segment_paths, video_path, fps: float = VIDEO_FPS):
+    """
+    Concatenate MP4 segments into a single video.
+    
+    Uses the ffmpeg concat demuxer with stream copy so segments are not
+    re-encoded. Falls back to decoding and re-writing with OpenCV when
+    ffmpeg is not available.
+    
+    Args:
+        segment_paths: Ordered list of segment MP4 paths
+        video_path: Output MP4 path
+        fps: Frame rate the segments were encoded at (used when re-encoding)
+    
+    Returns:
+        Concatenation method used ("stream_copy" or "reencode")
+    """
+    ffmpeg_path = shutil.which("ffmpeg")
+    if ffmpeg_path:
+        list_path = Path(segment_paths[0]).parent / "segments.txt"
+        with open(list_path, "w") as list_file:
+            for segment_path in segment_paths:
+                list_file.write(f"file '{Path(segment_path).resolve()}'\n")
+        subprocess.run(
+            [
+                ffmpeg_path, "-y", "-loglevel", "error",
+                "-f", "concat", "-safe", "0", "-i", str(list_path),
+                "-c", "copy", "-movflags", "+faststart", str(video_path)
+            ],
+            check=True,
+            capture_output=True
+        )
+        return "stream_copy"
+    
+    import cv2
+    
+    def iter_segment_frames():
+        for segment_path in segment_paths:
+            capture = cv2.VideoCapture(str(segment_path))
+            try:
+                while True:
+                    ok, frame = capture.read()
+                    if not ok:
+                        break
+                    yield frame
+            finally:
+                capture.release()
+    
+    writer = None
+    try:
+        for frame in iter_segment_frames():
+            if writer is None:
+                height, width = frame.shape[:2]
+                fourcc = cv2.VideoWriter_fourcc(*'mp4v')
+                writer = cv2.VideoWriter(str(video_path), fourcc, fps, (width, height))
+            writer.write(frame)
+    finally:
+        if writer is not None:
+            writer.release()
+    
+    return "reencode"
+
+
+def encode_segments_parallel(segments, text_language, sign_language, outputs, work_dir, max_workers):
+    """
+    Encode sentence segments in parallel worker processes and join them.
+    
+    Args:
+        segments: List of sentence strings
+        text_language: Source language
+        sign_language: Target sign language
+        outputs: List of output descriptions for the joined result
+        work_dir: Directory for intermediate segment files
+        max_workers: Number of worker processes
+    
+    Returns:
+        Dictionary with encoding details
+    """
+    with tempfile.TemporaryDirectory(dir=work_dir) as segment_dir:
+        tasks = []
+        for index, segment in enumerate(segments):
+            segment_outputs = [
+                dict(output, path=str(Path(segment_dir) / f"segment_{index:04d}_{Path(output['path']).name}"))
+                for output in outputs
+            ]
+            tasks.append((segment, segment_outputs))
+        
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=init_segment_worker,
+            initargs=(text_language, sign_language)
+        ) as executor:
+            segment_results = list(executor.map(encode_segment, tasks))
+        
+        segment_counts = [counts for counts, _ in segment_results]
+        # Segments of one translation come from the same dataset and share a frame rate
+        source_fps = segment_results[0][1] if segment_results else VIDEO_FPS
+        outputs = resolve_frame_rates(outputs, source_fps)
+        
+        frame_counts = {}
+        concat_method = None
+        for position, output in enumerate(outputs):
+            name = output["name"]
+            # Skip segments that produced nothing (e.g. nothing to sign)
+            segment_paths = [
+                task[1][position]["path"] for task, counts in zip(tasks, segment_counts)
+                if counts.get(name, 0) != 0 and os.path.exists(task[1][position]["path"])
+            ]
+            if not segment_paths:
+                frame_counts[name] = 0
+                continue
+            if output["kind"] == "image":
+                # The poster comes from the first segment
+                shutil.copyfile(segment_paths[0], output["path"])
+                frame_counts[name] = 1
+                continue
+            else:
+                concat_method = concatenate_segments(segment_paths, output["path"], output["fps"])
+            # Segments saved by the library have no frame count: the total is unknown too
+            counts_for_output = [counts.get(name, 0) for counts in segment_counts]
+            if any(count < 0 for count in counts_for_output):
+                frame_counts[name] = -1
+            else:
+                frame_counts[name] = sum(counts_for_output)
+    
+    return {
+        "frame_counts": frame_counts,
+        "segment_count": len(segments),
+        "worker_count": max_workers,
+        "concat_method": concat_method,
+        "source_fps": source_fps
+    }
+
+
+def write_landmark_stream(text: str, text_language: str, sign_language: str, stem: str, directory):
+    """
+    Synthesize the landmarks-only stream for client-side skeleton rendering.
+    
+    This is a second synthesis pass with a landmarks model: the video
+    model does not expose landmarks, but they come from the precomputed
+    landmark dataset, so no video frames are decoded. Writes a JSON file
+    (metadata + frames) and a raw little-endian float32 binary file with
+    the same data.
+    
+    Args:
+        text: Input text to translate
+        text_language: Source language
+        sign_language: Target sign language
+        stem: Base filename shared by all variants
+        directory: Directory the files are written to
+    
+    Returns:
+        Dictionary with the JSON and binary file paths (or None)
+    """
+    import numpy as np
+    
+    model = slt.models.ConcatenativeSynthesis(
+        text_language=text_language,
+        sign_language=sign_language,
+        sign_format="landmarks"
+    )
+    sign = model.translate(text)
+    
+    data = sign.numpy() if hasattr(sign, 'numpy') else getattr(sign, 'data', sign)
+    landmarks = np.asarray(data, dtype='<f4')
+    if landmarks.size == 0:
+        return None
+    
+    json_path = Path(directory) / f"{stem}_landmarks.json"
+    binary_path = Path(directory) / f"{stem}_landmarks.bin"
+    
+    landmarks.tofile(str(binary_path))
+    with open(json_path, "w") as json_file:
+        json.dump({
+            "fps": get_sign_fps(sign),
+            "shape": list(landmarks.shape),
+            "dtype": "float32",
+            "byte_order": "little",
+            "binary_file": binary_path.name,
+            "frames": landmarks.tolist()
+        }, json_file)
+    
+    return {"json_path": str(json_path), "binary_path": str(binary_path)}
+
+
+def output_url(path):
+    """Public URL the Node server serves a translation output file from"""
+    return f"/api/translations/video/{Path(path).name}"
+
+
+def record_outputs(result, outputs, frame_counts):
+    """
+    Add the paths and URLs of written outputs to the translation result.
+    
+    The first output is the primary video and keeps the existing
+    video_path / video_url fields; all outputs are listed under
+    "variants" when more than one was requested. Outputs skipped in
+    favour of another (same_as) point at that output's file, and
+    outputs that could not be produced are listed in "missing_variants".
+    """
+    written = [
+        output for output in outputs
+        if frame_counts.get(output["name"], 0) != 0 and os.path.exists(output["path"])
+    ]
+    
+    primary = outputs[0]
+    if primary in written:
+        if frame_counts[primary["name"]] > 0:
+            result["frame_count"] = frame_counts[primary["name"]]
+        result["video_path"] = primary["path"]
+        result["video_url"] = output_url(primary["path"])
+    else:
+        result["video_path"] = None
+        result["message"] = "Video translation successful but no frames available"
+    
+    if len(outputs) > 1:
+        variants = {}
+        for output in written:
+            variant = {
+                "kind": output["kind"],
+                "path": output["path"],
+                "url": output_url(output["path"]),
+                "max_height": output["max_height"],
+            }
+            if output["kind"] == "video":
+                variant["fps"] = output["fps"]
+            variants[output["name"]] = variant
+        
+        missing = []
+        for output in outputs:
+            if output["name"] in variants:
+                continue
+            same_as = output.get("same_as")
+            if same_as in variants:
+                variants[output["name"]] = dict(variants[same_as], same_as=same_as)
+            else:
+                missing.append(output["name"])
+        
+        result["variants"] = variants
+        if missing:
+            result["missing_variants"] = missing
+
+
+def translate_text_to_sign(text: str, text_language: str = "english", sign_language: str = "pk-sl", output_format: str = "video",
+                           encoding_mode: str = "pipelined", max_workers: int = None):
     """
     Translate text to sign language
     
@@ -29,22 +544,20 @@ def translate_text_to_sign(text: str, text_language: str = "english", sign_langu
         text: Input text to translate
         text_language: Source language (english, urdu, hindi)
         sign_language: Target sign language (pk-sl for Pakistan Sign Language)
-        output_format: Output format (video or landmarks)
+        output_format: Output format (video, landmarks or variants).
+            Variants writes the full video plus reduced-resolution and
+            reduced-frame-rate videos and a poster thumbnail from a single
+            pass over the frames, and a landmarks-only stream from a
+            second (landmark dataset) synthesis pass.
+        encoding_mode: Video encoding mode (pipelined or sequential).
+            Pipelined overlaps synthesis with encoding and encodes
+            multi-sentence input in parallel worker processes.
+        max_workers: Upper bound on worker processes (defaults to CPU count)
     
     Returns:
         Dictionary with translation result
     """
     try:
-        # Initialize the translation model
-        model = slt.models.ConcatenativeSynthesis(
-            text_language=text_language,
-            sign_language=sign_language,
-            sign_format=output_format
-        )
-        
-        # Translate text to sign
-        sign = model.translate(text)
-        
         # Create temporary directory for output files
         temp_dir = Path(tempfile.gettempdir()) / "signlearn_translations"
         temp_dir.mkdir(exist_ok=True)
@@ -57,61 +570,134 @@ def translate_text_to_sign(text: str, text_language: str = "english", sign_langu
             "output_format": output_format
         }
         
-        if output_format == "video":
-            # Save video to temp file
-            import hashlib
-            text_hash = hashlib.md5(text.encode()).hexdigest()[:8]
-            video_filename = f"translation_{text_hash}.mp4"
+        variants = output_format == "variants"
+        sign_format = "video" if variants else output_format
+        frame_counts = None
+        parallel = False
+        text_hash = hashlib.md5(text.encode()).hexdigest()[:8]
+        stem = f"translation_{text_hash}"
+        
+        if sign_format == "video":
+            result["encoding_mode"] = encoding_mode
+            video_filename = f"{stem}.mp4"
             video_path = temp_dir / video_filename
+            outputs = build_variant_outputs(stem, temp_dir) if variants else [video_output("full", video_path)]
             
-            # Save video - sign object from ConcatenativeSynthesis should be a Video or Sign wrapper
-            try:
-                # Try to save using the save method
-                if hasattr(sign, 'save'):
-                    sign.save(str(video_path), overwrite=True)
-                    result["video_path"] = str(video_path)
-                    result["video_url"] = f"/api/translations/video/{video_filename}"
-                elif hasattr(sign, 'frames') or hasattr(sign, 'iter_frames'):
-                    # If it's a Video object, try to write frames
-                    import cv2
-                    frames = list(sign.iter_frames()) if hasattr(sign, 'iter_frames') else sign.frames
-                    if frames and len(frames) > 0:
-                        # Get frame dimensions
-                        height, width = frames[0].shape[:2]
-                        fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-                        out = cv2.VideoWriter(str(video_path), fourcc, 30.0, (width, height))
-                        for frame in frames:
-                            # Convert RGB to BGR for OpenCV
-                            if len(frame.shape) == 3 and frame.shape[2] == 3:
-                                frame_bgr = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
-                                out.write(frame_bgr)
-                            else:
-                                out.write(frame)
-                        out.release()
-                        result["video_path"] = str(video_path)
-                        result["video_url"] = f"/api/translations/video/{video_filename}"
+            # Long inputs: encode independent sentences in parallel, then join
+            segments = split_into_segments(text) if encoding_mode == "pipelined" else [text]
+            cpu_count = os.cpu_count() or 1
+            worker_count = min(len(segments), max_workers or cpu_count, cpu_count)
+            # Without ffmpeg the join re-encodes everything, cancelling the gain
+            parallel = (
+                worker_count > 1 and
+                len(segments) >= PARALLEL_MIN_SEGMENTS and
+                len(text) >= PARALLEL_MIN_CHARS and
+                shutil.which("ffmpeg") is not None
+            )
+            if parallel:
+                try:
+                    encoding = encode_segments_parallel(
+                        segments, text_language, sign_language, outputs, temp_dir, worker_count
+                    )
+                    frame_counts = encoding.pop("frame_counts")
+                    outputs = resolve_frame_rates(outputs, encoding.pop("source_fps"))
+                    result.update(encoding)
+                except Exception as parallel_error:
+                    # Fall back to encoding the whole text in this process
+                    result["parallel_error"] = str(parallel_error)
+                    parallel = False
+        
+        if not parallel:
+            # Initialize the translation model
+            model = slt.models.ConcatenativeSynthesis(
+                text_language=text_language,
+                sign_language=sign_language,
+                sign_format=sign_format
+            )
+            
+            # Translate text to sign
+            sign = model.translate(text)
+            
+            if sign_format == "video":
+                outputs = resolve_frame_rates(outputs, get_sign_fps(sign))
+                # Save video - sign object from ConcatenativeSynthesis should be a Video or Sign wrapper
+                try:
+                    frames = get_sign_frames(sign) if encoding_mode == "pipelined" or variants else None
+                    if frames is not None:
+                        # Overlap frame synthesis with encoding, fanning out to every output
+                        frame_counts = write_outputs_pipelined(frames, outputs)
+                    # Try to save using the save method
+                    elif hasattr(sign, 'save'):
+                        sign.save(str(video_path), overwrite=True)
+                        # Only the primary video exists, other variants are reported missing
+                        frame_counts = {outputs[0]["name"]: -1}
+                    elif hasattr(sign, 'frames') or hasattr(sign, 'iter_frames'):
+                        # If it's a Video object, try to write frames
+                        import cv2
+                        frames = list(sign.iter_frames()) if hasattr(sign, 'iter_frames') else sign.frames
+                        if frames and len(frames) > 0:
+                            # Get frame dimensions
+                            height, width = frames[0].shape[:2]
+                            fourcc = cv2.VideoWriter_fourcc(*'mp4v')
+                            out = cv2.VideoWriter(str(video_path), fourcc, get_sign_fps(sign), (width, height))
+                            for frame in frames:
+                                # Convert RGB to BGR for OpenCV
+                                if len(frame.shape) == 3 and frame.shape[2] == 3:
+                                    frame_bgr = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
+                                    out.write(frame_bgr)
+                                else:
+                                    out.write(frame)
+                            out.release()
+                            result["video_path"] = str(video_path)
+                            result["video_url"] = f"/api/translations/video/{video_filename}"
+                        else:
+                            result["video_path"] = None
+                            result["message"] = "Video translation successful but no frames available"
                     else:
+                        # Just indicate success even if we can't save
                         result["video_path"] = None
-                        result["message"] = "Video translation successful but no frames available"
-                else:
-                    # Just indicate success even if we can't save
+                        result["message"] = "Video translation successful. Check sign object type."
+                except Exception as save_error:
                     result["video_path"] = None
-                    result["message"] = "Video translation successful. Check sign object type."
-            except Exception as save_error:
-                result["video_path"] = None
-                result["save_error"] = str(save_error)
-                result["message"] = "Translation completed but video save failed"
-        else:
-            # For landmarks format, save as JSON
-            landmarks_filename = f"translation_{hash(text) % 1000000}.json"
-            landmarks_path = temp_dir / landmarks_filename
-            
-            if hasattr(sign, 'save'):
-                sign.save(str(landmarks_path))
-                result["landmarks_path"] = str(landmarks_path)
+                    result["save_error"] = str(save_error)
+                    result["message"] = "Translation completed but video save failed"
             else:
-                result["landmarks_path"] = None
-                result["message"] = "Landmarks translation successful"
+                # For landmarks format, save as JSON
+                landmarks_filename = f"{stem}.json"
+                landmarks_path = temp_dir / landmarks_filename
+                
+                if hasattr(sign, 'save'):
+                    sign.save(str(landmarks_path))
+                    result["landmarks_path"] = str(landmarks_path)
+                else:
+                    result["landmarks_path"] = None
+                    result["message"] = "Landmarks translation successful"
+        
+        if frame_counts is not None:
+            record_outputs(result, outputs, frame_counts)
+        elif variants:
+            result["missing_variants"] = [output["name"] for output in outputs]
+        
+        if variants:
+            # Landmarks-only stream for client-side skeleton rendering
+            try:
+                stream = write_landmark_stream(text, text_language, sign_language, stem, temp_dir)
+            except Exception as landmarks_error:
+                stream = None
+                result["landmarks_error"] = str(landmarks_error)
+            if stream:
+                result["landmarks_path"] = stream["json_path"]
+                result.setdefault("variants", {})["landmarks"] = {
+                    "kind": "landmarks",
+                    "path": stream["json_path"],
+                    "url": output_url(stream["json_path"]),
+                    "binary_path": stream["binary_path"],
+                    "binary_url": output_url(stream["binary_path"]),
+                    # Not part of the frame fan-out: synthesized from the landmark dataset
+                    "separate_synthesis": True,
+                }
+            else:
+                result.setdefault("missing_variants", []).append("landmarks")
         
         return result
         
@@ -140,6 +726,8 @@ def main():
         text_language = input_data.get("text_language", "english")
         sign_language = input_data.get("sign_language", "pk-sl")
         output_format = input_data.get("output_format", "video")
+        encoding_mode = input_data.get("encoding_mode", "pipelined")
+        max_workers = input_data.get("max_workers")
         
         if not text:
             print(json.dumps({
@@ -149,7 +737,9 @@ def main():
             sys.exit(1)
         
         # Perform translation
-        result = translate_text_to_sign(text, text_language, sign_language, output_format)
+        result = translate_text_to_sign(
+            text, text_language, sign_language, output_format, encoding_mode, max_workers
+        )
         
         # Output result as JSON
         print(json.dumps(result))